@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import functools
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 REPO_ROOT = Path(__file__).resolve().parents[2]  # .../aifx
 if str(REPO_ROOT) not in sys.path:
@@ -12,16 +15,17 @@ if str(REPO_ROOT) not in sys.path:
 
 from PySide6 import QtCore, QtWidgets, QtGui
 
-from core.packaging.aifi_packager import build_aifi
-from core.packaging.aifv_packager import build_aifv
+# The packagers and validator bridge pull in zip/hash machinery; they are
+# imported inside the worker run() methods so cold start only pays for
+# PySide6 and the stdlib.
 from core.provenance.sda_templates import AIFX_SDA_001_TEXT
-from ui.desktop.validator_bridge import validate_package_local
 
 # -----------------------------
 # Constants / helpers
 # -----------------------------
 
-def _format_check_value(k: str, v: object) -> str:
+@functools.lru_cache(maxsize=512)
+def _format_check_value_cached(k: str, vtype: str, v: object) -> str:
     # Normalize integrity string values from canonical validator
     if k == "integrity" and isinstance(v, str):
         if v.lower() == "ok":
@@ -31,45 +35,151 @@ def _format_check_value(k: str, v: object) -> str:
     return str(v)
 
 
+def _format_check_value(k: str, v: object) -> str:
+    # Check keys/values repeat heavily across packages in a batch; memoize the
+    # rendered string. Non-hashable values fall back to their repr. The type
+    # name is part of the cache key: True/1/1.0 compare (and hash) equal but
+    # render differently, so keying on (k, v) alone would poison the cache.
+    if not isinstance(v, (str, int, float, bool, type(None))):
+        v = repr(v)
+    return _format_check_value_cached(k, type(v).__name__, v)
+
+
+# Deterministic grouping order, dispatched on the first dotted segment
+_BUCKET_BY_SEGMENT = {
+    "files": 10,
+    "security": 20,
+    "manifest": 30,
+    "work": 30,
+    "integrity": 40,
+    "info": 50,
+}
+
+
 def _check_bucket(k: str) -> int:
-    # Deterministic grouping order
-    if k.startswith("files."):
-        return 10
-    if k.startswith("security."):
-        return 20
-    if k.startswith(("manifest.", "work.", "author", "contact", "ai_declared", "aifx_version")):
-        return 30
-    if k == "integrity" or k.startswith("integrity."):
+    seg, sep, _ = k.partition(".")
+    if sep:
+        b = _BUCKET_BY_SEGMENT.get(seg)
+        if b is not None:
+            return b
+    if k == "integrity":
         return 40
-    if k.startswith("info."):
-        return 50
+    if k.startswith(("author", "contact", "ai_declared", "aifx_version")):
+        return 30
     return 90
 
 
 def _iter_checks_grouped(checks: dict) -> list[tuple[str, object]]:
-    items = list(checks.items())
-    items.sort(key=lambda kv: (_check_bucket(kv[0]), kv[0]))
-    return items
-
-
-AIFX_PACKAGE_EXTS = (".aifx", ".aifm", ".aifv", ".aifi", ".aifp")
-
-AUDIO_EXTS = (".wav", ".mp3", ".flac", ".m4a", ".ogg")
-VIDEO_EXTS = (".mp4", ".mov", ".webm", ".m4v")
-IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".webp")
+    # Decorate once, sort on the precomputed (bucket, key) pair, undecorate.
+    keyed = [((_check_bucket(k), k), (k, v)) for k, v in checks.items()]
+    keyed.sort(key=lambda t: t[0])
+    return [kv for _, kv in keyed]
+
+
+def _render_report(out_path: str, v: dict) -> str:
+    # Post-convert validation summary, rendered in the worker thread so the
+    # GUI thread only has to do a single setPlainText.
+    valid = bool(v.get("valid", False))
+    errs = v.get("errors", []) or []
+    warns = v.get("warnings", []) or []
+    checks = v.get("checks", {}) or {}
+
+    lines: list[str] = [f"[OK] Wrote: {out_path}", ""]
+    lines.append(f"Post-validate: {'PASS' if valid and not errs else 'FAIL'}")
+    if checks:
+        lines.append("Checks:")
+        for k, vv in _iter_checks_grouped(checks):
+            lines.append(f"  - {k}: {_format_check_value(k, vv)}")
+    if warns:
+        lines.append("Warnings:")
+        for w in warns:
+            lines.append(f"  - {w}")
+    if errs:
+        lines.append("Errors:")
+        for e in errs:
+            lines.append(f"  - {e}")
+    return "\n".join(lines)
+
+
+# frozensets: the folder walkers test membership per entry, and a hash
+# lookup on the short suffix beats rescanning a tuple with endswith.
+AIFX_PACKAGE_EXTS = frozenset({".aifx", ".aifm", ".aifv", ".aifi", ".aifp"})
+
+AUDIO_EXTS = frozenset({".wav", ".mp3", ".flac", ".m4a", ".ogg"})
+VIDEO_EXTS = frozenset({".mp4", ".mov", ".webm", ".m4v"})
+IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".webp"})
+
+
+def _ext_of(name: str) -> str:
+    # Only the final suffix matters; rpartition avoids splitext's dirname
+    # handling and lowercases just the few chars after the dot.
+    _, sep, ext = name.rpartition(".")
+    return "." + ext.lower() if sep else ""
 
 PRODUCTION_ORG_NAME = "AI-First-Exchange"
 PRODUCTION_APP_NAME = "AIFX Desktop"
 
+_SUPPORTING_SPLIT = re.compile(r"\s*,\s*")
+
+def _split_supporting_tools(text: str) -> list[str]:
+    # Comma-separated names, whitespace-tolerant, capped at the v0 max of 3.
+    return [t for t in _SUPPORTING_SPLIT.split(text.strip()) if t][:3]
 
+
+@functools.lru_cache(maxsize=4096)
 def _abs(p: str) -> str:
+    # Safe to memoize: the app never chdirs, so abspath is stable per input.
     return os.path.abspath(os.path.expanduser(p))
 
+_HOME_STR = os.path.expanduser("~")
+
+# File-dialog filter strings, built once at import so the browse handlers
+# don't re-assemble them per click. Keep the extension lists in sync with
+# the *_EXTS sets above.
+_PACKAGES_FILTER = "AIFX Packages (*.aifx *.aifm *.aifv *.aifi *.aifp)"
+_AUDIO_FILTER = "Audio Files (*.wav *.mp3 *.flac *.m4a *.ogg)"
+_VIDEO_FILTER = "Video (*.mp4 *.mov *.webm *.m4v);;All files (*)"
+_THUMB_FILTER = "Image (*.jpg *.jpeg *.png *.webp);;All files (*)"
+_IMAGE_FILTER = "Image (*.png *.jpg *.jpeg *.webp);;All files (*)"
+_COVER_FILTER = "Images (*.png *.jpg *.jpeg *.webp)"
+_AIFM_FILTER = "AIFM Package (*.aifm);;All files (*)"
+_AIFV_FILTER = "AIFV Package (*.aifv);;All files (*)"
+_AIFI_FILTER = "AIFI Package (*.aifi);;All files (*)"
+
+def _safe_parent_dir(s: str) -> str:
+    # Parent dir for dialog start locations; skip Path.resolve() (stat/readlink
+    # syscalls) when the path is already absolute and not a symlink.
+    p = Path(s).expanduser()
+    if p.is_absolute() and not p.is_symlink():
+        return str(p.parent)
+    return str(p.resolve().parent)
+
 def resource_path(rel_path: str) -> str:
     base = Path(getattr(sys, "_MEIPASS")) if hasattr(sys, "_MEIPASS") else REPO_ROOT
     return str((base / rel_path).resolve())
 
 
+_APP_ICON: Optional[QtGui.QIcon] = None
+
+def _app_icon() -> QtGui.QIcon:
+    # Decode the icon once per process; every window shares the cached pixmap.
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QtGui.QIcon(resource_path("ui/desktop/assets/AIFX_1024.png"))
+    return _APP_ICON
+
+
+_BG_PIXMAP: Optional[QtGui.QPixmap] = None
+
+def _background_pixmap() -> QtGui.QPixmap:
+    # Decode the ~1 MB background PNG once per process; every window
+    # shares the same texture.
+    global _BG_PIXMAP
+    if _BG_PIXMAP is None:
+        _BG_PIXMAP = QtGui.QPixmap(resource_path("ui/desktop/assets/aifxbackground.png"))
+    return _BG_PIXMAP
+
+
 def _declaration_view() -> QtWidgets.QPlainTextEdit:
     box = QtWidgets.QPlainTextEdit(AIFX_SDA_001_TEXT)
     box.setReadOnly(True)
@@ -87,40 +197,101 @@ def _declaration_view() -> QtWidgets.QPlainTextEdit:
     return box
 
 
-def collect_packages(selected_files: list[str], selected_folder: str | None = None) -> list[str]:
-    files: list[str] = []
+_INPUT_TYPES = (QtWidgets.QLineEdit, QtWidgets.QTextEdit, QtWidgets.QPlainTextEdit)
 
-    for p in selected_files or []:
-        if p.lower().endswith(AIFX_PACKAGE_EXTS) and os.path.isfile(p):
-            files.append(_abs(p))
+def _configure_edit(le: QtWidgets.QLineEdit) -> None:
+    # Shared setup for form line edits: readable width, clear button
+    le.setMinimumWidth(60)
+    le.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+    le.setClearButtonEnabled(True)
 
-    if selected_folder:
-        for root, _, names in os.walk(selected_folder):
-            for name in names:
-                if name.lower().endswith(AIFX_PACKAGE_EXTS):
-                    fp = os.path.join(root, name)
-                    if os.path.isfile(fp):
-                        files.append(_abs(fp))
 
-    return sorted(set(files))
+def _tag_inputs(root: QtWidgets.QWidget) -> None:
+    # The app stylesheet matches inputs via [class="aifxInput"] rather than
+    # three type selectors; tag descendants once when a page is built.
+    for w in root.findChildren(_INPUT_TYPES):
+        w.setProperty("class", "aifxInput")
+
 
+# Directories that never hold user packages but can dwarf the rest of the
+# tree on developer machines; dot-directories are pruned as well.
+_PRUNED_DIRS = frozenset({"node_modules", "__pycache__", ".git", ".venv"})
 
-def collect_sources_by_ext(selected_files: list[str], selected_folder: str | None, exts: tuple[str, ...]) -> list[str]:
+
+def _walk_scandir(root: str, exts: frozenset[str], *, recursive: bool = True) -> Iterator[str]:
+    # os.walk stats every entry and then we stat matches again via isfile;
+    # scandir answers both from the cached DirEntry, so a matched file costs
+    # roughly one syscall instead of three.
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not recursive:
+                        continue
+                    if entry.name.startswith(".") or entry.name in _PRUNED_DIRS:
+                        continue
+                    yield from _walk_scandir(entry.path, exts)
+                elif _ext_of(entry.name) in exts and entry.is_file(follow_symlinks=False):
+                    yield entry.path
+            except OSError:
+                continue
+
+
+def collect_packages(
+    selected_files: list[str],
+    selected_folder: str | None = None,
+    *,
+    recursive: bool = True,
+) -> list[str]:
+    seen: set[str] = set()
     files: list[str] = []
 
     for p in selected_files or []:
-        if p.lower().endswith(exts) and os.path.isfile(p):
-            files.append(_abs(p))
+        if _ext_of(p) in AIFX_PACKAGE_EXTS and os.path.isfile(p):
+            ap = _abs(p)
+            if ap not in seen:
+                seen.add(ap)
+                files.append(ap)
 
     if selected_folder:
-        for root, _, names in os.walk(selected_folder):
-            for name in names:
-                if name.lower().endswith(exts):
-                    fp = os.path.join(root, name)
-                    if os.path.isfile(fp):
-                        files.append(_abs(fp))
+        for fp in _walk_scandir(selected_folder, AIFX_PACKAGE_EXTS, recursive=recursive):
+            ap = _abs(fp)
+            if ap not in seen:
+                seen.add(ap)
+                files.append(ap)
+
+    return sorted(files)
+
+
+def collect_sources_by_ext(
+    selected_files: list[str],
+    selected_folder: str | None,
+    exts: frozenset[str],
+    *,
+    recursive: bool = True,
+) -> list[str]:
+    seen: set[str] = set()
+    files: list[str] = []
+
+    for p in selected_files or []:
+        if _ext_of(p) in exts and os.path.isfile(p):
+            ap = _abs(p)
+            if ap not in seen:
+                seen.add(ap)
+                files.append(ap)
 
-    return sorted(set(files))
+    if selected_folder:
+        for fp in _walk_scandir(selected_folder, exts, recursive=recursive):
+            ap = _abs(fp)
+            if ap not in seen:
+                seen.add(ap)
+                files.append(ap)
+
+    return sorted(files)
 
 
 # -----------------------------
@@ -136,21 +307,36 @@ class AppDefaults:
 def _qsettings() -> QtCore.QSettings:
     return QtCore.QSettings()
 
+# Defaults are read on every enable-state refresh (i.e. per keystroke);
+# cache the dataclass and let save_defaults keep it current so only the
+# first read touches the settings backend.
+_DEFAULTS_CACHE: AppDefaults | None = None
+
 def load_defaults() -> AppDefaults:
-    qs = _qsettings()
-    return AppDefaults(
-        creator_name=str(qs.value("defaults/creator_name", "")),
-        creator_email=str(qs.value("defaults/creator_email", "")),
-        default_mode=str(qs.value("defaults/default_mode", "")),
-        default_output_dir=str(qs.value("defaults/default_output_dir", "")),
-    )
+    global _DEFAULTS_CACHE
+    if _DEFAULTS_CACHE is None:
+        qs = _qsettings()
+        _DEFAULTS_CACHE = AppDefaults(
+            creator_name=str(qs.value("defaults/creator_name", "")),
+            creator_email=str(qs.value("defaults/creator_email", "")),
+            default_mode=str(qs.value("defaults/default_mode", "")),
+            default_output_dir=str(qs.value("defaults/default_output_dir", "")),
+        )
+    return _DEFAULTS_CACHE
 
 def save_defaults(d: AppDefaults) -> None:
+    global _DEFAULTS_CACHE
     qs = _qsettings()
     qs.setValue("defaults/creator_name", d.creator_name.strip())
     qs.setValue("defaults/creator_email", d.creator_email.strip())
     qs.setValue("defaults/default_mode", d.default_mode.strip())
     qs.setValue("defaults/default_output_dir", d.default_output_dir.strip())
+    _DEFAULTS_CACHE = AppDefaults(
+        creator_name=d.creator_name.strip(),
+        creator_email=d.creator_email.strip(),
+        default_mode=d.default_mode.strip(),
+        default_output_dir=d.default_output_dir.strip(),
+    )
 
 # -----------------------------
 # UI pieces
@@ -158,60 +344,18 @@ def save_defaults(d: AppDefaults) -> None:
 class SidebarButton(QtWidgets.QPushButton):
     def __init__(self, text: str, *, indent: int = 0) -> None:
         super().__init__(text)
+        # Styling lives in _APP_QSS, keyed on the object name and the indent
+        # property, so the sheet is parsed once instead of per button.
+        self.setObjectName("SidebarButton")
+        self.setProperty("indent", indent)
         self.setCheckable(True)
         self.setCursor(QtCore.Qt.PointingHandCursor)
 
-        pad_left = 12 + indent if indent else 12
-
-        self.setStyleSheet(f"""
-            QPushButton {{
-                text-align: left;
-                padding: 10px 12px;
-                padding-left: {pad_left}px;
-                border: 1px solid transparent;
-                border-radius: 10px;
-                background: transparent;
-                color: rgba(255, 255, 255, 0.88);
-            }}
-
-            QPushButton:hover {{
-                background: rgba(255, 255, 255, 0.06);
-                border: 1px solid rgba(255, 255, 255, 0.10);
-            }}
-
-            QPushButton:checked {{
-                font-weight: 800;
-                color: #ffffff;
-                border: 1px solid rgba(255, 255, 255, 0.22);
-
-                /* "metallic" highlight */
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(255,255,255,0.22),
-                    stop:0.45 rgba(255,255,255,0.12),
-                    stop:1 rgba(0,0,0,0.18)
-                );
-            }}
-
-            QPushButton:checked:hover {{
-                border: 1px solid rgba(255, 255, 255, 0.30);
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(255,255,255,0.26),
-                    stop:0.45 rgba(255,255,255,0.14),
-                    stop:1 rgba(0,0,0,0.20)
-                );
-            }}
-        """)
-
 class DropZone(QtWidgets.QFrame):
     pathDropped = QtCore.Signal(str)
 
     def __init__(self, label_text: str = "Drop files here") -> None:
         super().__init__()
-        bg = resource_path("ui/desktop/assets/aifxbackground.png")
-        self.setStyleSheet(f"QMainWindow {{ background-image: url('{bg}'); background-position: center; background-repeat: repeat; }}")
-
         self.setAcceptDrops(True)
         self.setFrameShape(QtWidgets.QFrame.StyledPanel)
         self.setFrameShadow(QtWidgets.QFrame.Raised)
@@ -241,41 +385,77 @@ class DropZone(QtWidgets.QFrame):
 # -----------------------------
 # Workers
 # -----------------------------
-class ValidateWorker(QtCore.QObject):
-    finished = QtCore.Signal(object)  # list[(path, result)]
-    error = QtCore.Signal(str)
+class WorkerSignals(QtCore.QObject):
+    # (payload, error_message) — error_message is empty on success
+    done = QtCore.Signal(object, str)
+    # (path, result) — streamed per package by ValidateWorker
+    progress = QtCore.Signal(str, object)
+
+
+class ValidateWorker(QtCore.QRunnable):
+    # Runs on the shared QThreadPool instead of a per-click QThread.
 
     def __init__(self, package_paths: list[str]) -> None:
         super().__init__()
+        self.signals = WorkerSignals()
         self.package_paths = package_paths
+        self._stop = False
+
+    def cancel(self) -> None:
+        # Plain bool flip is atomic enough here; the run loop re-reads it
+        # per package and the pool thread is released shortly after.
+        self._stop = True
+
+    def _validate_one(self, fp: str) -> tuple[str, dict | None]:
+        if self._stop:
+            return fp, None
+        try:
+            from ui.desktop.validator_bridge import validate_package_local
+
+            return fp, validate_package_local(fp)
+        except Exception as e:
+            return fp, {"valid": False, "errors": [str(e)], "warnings": [], "checks": {}}
 
-    @QtCore.Slot()
     def run(self) -> None:
         try:
-            results: list[tuple[str, dict]] = []
-            for fp in self.package_paths:
-                try:
-                    res = validate_package_local(fp)
-                    results.append((fp, res))
-                except Exception as e:
-                    results.append((fp, {"valid": False, "errors": [str(e)], "warnings": [], "checks": {}}))
-            self.finished.emit(results)
+            # Per-package validation is I/O bound (zip read + hashing), so
+            # overlap the disk work and stream each result as it lands
+            # instead of buffering the whole batch behind "Running…".
+            workers = min(8, os.cpu_count() or 4, max(1, len(self.package_paths)))
+            passes = 0
+            fails = 0
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = [ex.submit(self._validate_one, fp) for fp in self.package_paths]
+                for fut in as_completed(futures):
+                    if self._stop:
+                        for pending in futures:
+                            pending.cancel()
+                        break
+                    fp, res = fut.result()
+                    if res is None:  # cancelled after submission
+                        continue
+                    if bool(res.get("valid", False)) and not (res.get("errors") or []):
+                        passes += 1
+                    else:
+                        fails += 1
+                    self.signals.progress.emit(fp, res)
+            self.signals.done.emit((passes, fails), "")
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.done.emit(None, str(e))
 
-class ConvertMusicWorker(QtCore.QObject):
-    finished = QtCore.Signal(object)  # (out_path: str, validated: dict|None)
-    error = QtCore.Signal(str)
+class ConvertMusicWorker(QtCore.QRunnable):
+    # payload is (out_path, validated, report)
 
     def __init__(self, aifm_inputs: object, out_path: str) -> None:
         super().__init__()
+        self.signals = WorkerSignals()
         self.aifm_inputs = aifm_inputs
         self.out_path = out_path
 
-    @QtCore.Slot()
     def run(self) -> None:
         try:
             from core.conversion.aifm_converter import convert_to_aifm
+            from ui.desktop.validator_bridge import validate_package_local
 
             out = convert_to_aifm(self.aifm_inputs, Path(self.out_path))
             # Optional: auto-validate output after conversion
@@ -284,13 +464,12 @@ class ConvertMusicWorker(QtCore.QObject):
             except Exception as e:
                 v = {"valid": False, "errors": [f"Post-validate error: {e}"], "warnings": [], "checks": {}}
 
-            self.finished.emit((str(out), v))
+            self.signals.done.emit((str(out), v, _render_report(str(out), v)), "")
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.done.emit(None, str(e))
 
-class PackAIFVWorker(QtCore.QObject):
-    finished = QtCore.Signal(object)  # payload
-    error = QtCore.Signal(str)
+class PackAIFVWorker(QtCore.QRunnable):
+    # payload is (out_path, validated, report)
 
     def __init__(
         self,
@@ -307,6 +486,7 @@ class PackAIFVWorker(QtCore.QObject):
         origin_url: str,
     ) -> None:
         super().__init__()
+        self.signals = WorkerSignals()
         self.video_path = video_path
         self.thumb_path = thumb_path
         self.out_path = out_path
@@ -319,10 +499,10 @@ class PackAIFVWorker(QtCore.QObject):
         self.supporting_tools = supporting_tools
         self.origin_url = origin_url
 
-    @QtCore.Slot()
     def run(self) -> None:
         try:
-            from core.packaging.aifv_packager import AIFVInputs, ProvenanceTool
+            from core.packaging.aifv_packager import AIFVInputs, ProvenanceTool, build_aifv
+            from ui.desktop.validator_bridge import validate_package_local
 
             supporting = [ProvenanceTool(name=n) for n in self.supporting_tools[:3] if n]
 
@@ -345,14 +525,13 @@ class PackAIFVWorker(QtCore.QObject):
             )
             # Auto-validate
             v = validate_package_local(str(out))
-            self.finished.emit((str(out), v))
+            self.signals.done.emit((str(out), v, _render_report(str(out), v)), "")
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.done.emit(None, str(e))
 
 
-class PackAIFIWorker(QtCore.QObject):
-    finished = QtCore.Signal(object)  # payload
-    error = QtCore.Signal(str)
+class PackAIFIRunnable(QtCore.QRunnable):
+    # Runs on the shared QThreadPool instead of a per-click QThread.
 
     def __init__(
         self,
@@ -366,6 +545,7 @@ class PackAIFIWorker(QtCore.QObject):
         supporting_tools: list[str],
     ) -> None:
         super().__init__()
+        self.signals = WorkerSignals()
         self.image_path = image_path
         self.out_path = out_path
         self.title = title
@@ -375,9 +555,11 @@ class PackAIFIWorker(QtCore.QObject):
         self.primary_tool = primary_tool
         self.supporting_tools = supporting_tools
 
-    @QtCore.Slot()
     def run(self) -> None:
         try:
+            from core.packaging.aifi_packager import build_aifi
+            from ui.desktop.validator_bridge import validate_package_local
+
             out = build_aifi(
                 image_path=Path(self.image_path),
                 out_path=Path(self.out_path),
@@ -389,9 +571,9 @@ class PackAIFIWorker(QtCore.QObject):
                 supporting_tools=self.supporting_tools[:3],
             )
             v = validate_package_local(str(out))
-            self.finished.emit((str(out), v))
+            self.signals.done.emit((str(out), v, _render_report(str(out), v)), "")
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.done.emit(None, str(e))
 
 
 
@@ -405,11 +587,11 @@ class HomePanel(QtWidgets.QWidget):
 
         # --- Title
         title = QtWidgets.QLabel("AIFX Desktop (v0)")
-        title.setStyleSheet("font-size: 20px; font-weight: 900;")
+        title.setObjectName("homeTitle")
         layout.addWidget(title)
 
         subtitle = QtWidgets.QLabel("Converter + Validator for AI-First Exchange packages.")
-        subtitle.setStyleSheet("opacity: 0.8;")
+        subtitle.setObjectName("mutedLabel")
         layout.addWidget(subtitle)
 
         layout.addSpacing(12)
@@ -445,7 +627,7 @@ GitHub: AI-First-Exchange / aifx-desktop
         body.setWordWrap(True)
         body.setTextFormat(QtCore.Qt.RichText)
         body.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
-        body.setStyleSheet("font-size: 13px; opacity: 0.95;")
+        body.setObjectName("homeBody")
 
         layout.addWidget(body)
         layout.addStretch(1)
@@ -459,7 +641,7 @@ class DefaultsPanel(QtWidgets.QWidget):
         layout = QtWidgets.QVBoxLayout(self)
 
         title = QtWidgets.QLabel("Defaults")
-        title.setStyleSheet("font-size: 16px; font-weight: 800;")
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
 
         self.creator_name = QtWidgets.QLineEdit()
@@ -498,7 +680,7 @@ class DefaultsPanel(QtWidgets.QWidget):
         layout.addWidget(self.save_btn)
 
         self.status = QtWidgets.QLabel("")
-        self.status.setStyleSheet("opacity: 0.8;")
+        self.status.setObjectName("mutedLabel")
         layout.addWidget(self.status)
         layout.addStretch(1)
 
@@ -515,7 +697,7 @@ class DefaultsPanel(QtWidgets.QWidget):
             self.mode_combo.setCurrentIndex(idx)
 
     def _browse_outdir(self) -> None:
-        d = QtWidgets.QFileDialog.getExistingDirectory(self, "Choose default output folder", self.output_dir.text() or str(Path.home()))
+        d = QtWidgets.QFileDialog.getExistingDirectory(self, "Choose default output folder", self.output_dir.text() or _HOME_STR)
         if d:
             self.output_dir.setText(d)
 
@@ -534,16 +716,17 @@ class DefaultsPanel(QtWidgets.QWidget):
 class ValidatePanel(QtWidgets.QWidget):
     def __init__(self) -> None:
         super().__init__()
-        self._thread: Optional[QtCore.QThread] = None
-        self._worker: Optional[ValidateWorker] = None
+        self._runnable: Optional[ValidateWorker] = None
 
         self.selected_files: list[str] = []
         self.selected_folder: Optional[str] = None
+        # Where the last successful browse landed; reused as the next start dir.
+        self._last_browse_dir = ""
 
         layout = QtWidgets.QVBoxLayout(self)
 
         title = QtWidgets.QLabel("Validate")
-        title.setStyleSheet("font-size: 16px; font-weight: 800;")
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
 
         self.drop = DropZone("Drop .aifm/.aifv/.aifi/.aifp (or .aifx) here\n(or use Browse)")
@@ -570,6 +753,10 @@ class ValidatePanel(QtWidgets.QWidget):
         self.results.setReadOnly(True)
         self.results.setLineWrapMode(QtWidgets.QPlainTextEdit.WidgetWidth)
 
+        # Log widget: no undo history, bounded block count
+        self.results.setUndoRedoEnabled(False)
+        self.results.setMaximumBlockCount(2000)
+
         fm = self.results.fontMetrics()
         lines = 14  # adjust 10–15 to taste
         h = (fm.lineSpacing() * lines) + 16
@@ -582,22 +769,21 @@ class ValidatePanel(QtWidgets.QWidget):
         layout.addWidget(self.results)  # <-- no stretch factor
 
         self.status = QtWidgets.QLabel("")
-        self.status.setStyleSheet("opacity: 0.8;")
+        self.status.setObjectName("mutedLabel")
         layout.addWidget(self.status)
 
         layout.addStretch(1)  # optional: keeps layout balanced
 
     def _on_drop(self, p: str) -> None:
-        pp = Path(p)
         self.selected_files = []
         self.selected_folder = None
 
-        if pp.is_dir():
-            self.selected_folder = str(pp)
-            self.status.setText(f"Folder selected: {pp}")
+        if os.path.isdir(p):
+            self.selected_folder = p
+            self.status.setText(f"Folder selected: {p}")
         else:
-            self.selected_files = [str(pp)]
-            self.status.setText(f"File selected: {pp}")
+            self.selected_files = [p]
+            self.status.setText(f"File selected: {p}")
 
         self.validate_btn.setEnabled(True)
 
@@ -605,19 +791,23 @@ class ValidatePanel(QtWidgets.QWidget):
         files, _ = QtWidgets.QFileDialog.getOpenFileNames(
             self,
             "Select AIFX package(s)",
-            "",
-            "AIFX Packages (*.aifx *.aifm *.aifv *.aifi *.aifp)",
+            self._last_browse_dir,
+            _PACKAGES_FILTER,
         )
         if files:
             self.selected_files = files
             self.selected_folder = None
+            self._last_browse_dir = _safe_parent_dir(files[0])
             self.status.setText(f"{len(files)} file(s) selected.")
             self.validate_btn.setEnabled(True)
 
     def _browse_folder(self) -> None:
-        folder = QtWidgets.QFileDialog.getExistingDirectory(self, "Select folder to scan (recursive)", "")
+        folder = QtWidgets.QFileDialog.getExistingDirectory(
+            self, "Select folder to scan (recursive)", self._last_browse_dir
+        )
         if folder:
             self.selected_folder = folder
+            self._last_browse_dir = folder
             self.selected_files = []
             self.status.setText(f"Folder selected: {folder}")
             self.validate_btn.setEnabled(True)
@@ -629,81 +819,107 @@ class ValidatePanel(QtWidgets.QWidget):
             QtWidgets.QMessageBox.information(self, "No input", "Pick a package or folder first.")
             return
 
-        self.results.clear()
-        self.results.appendPlainText("Running local validation…")
+        self.results.setPlainText("Running local validation…")
         self.validate_btn.setEnabled(False)
 
-        self._thread = QtCore.QThread(self)
-        self._worker = ValidateWorker(targets)
-        self._worker.moveToThread(self._thread)
-
-        self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self._on_finished)
-        self._worker.error.connect(self._on_error)
-
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.finished.connect(self._worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
+        self._runnable = ValidateWorker(targets)
+        # Always cross-thread (worker emits from the pool): pin QueuedConnection
+        # so emit skips the per-signal thread-affinity check.
+        self._runnable.signals.progress.connect(
+            self._on_progress, QtCore.Qt.QueuedConnection
+        )
+        self._runnable.signals.done.connect(
+            self._on_done, QtCore.Qt.QueuedConnection
+        )
+        QtCore.QThreadPool.globalInstance().start(self._runnable)
 
-        self._worker.error.connect(self._thread.quit)
-        self._worker.error.connect(self._worker.deleteLater)
+    def cancel_active(self) -> None:
+        if self._runnable is not None:
+            self._runnable.cancel()
 
-        self._thread.start()
+    def _on_done(self, payload: object, err: str) -> None:
+        self._runnable = None
+        if err:
+            self._on_error(err)
+        else:
+            self._on_finished(payload)
 
     def _on_error(self, msg: str) -> None:
-        self.results.appendPlainText("")
-        self.results.appendPlainText(f"ERROR: {msg}")
+        self.results.appendPlainText(f"\nERROR: {msg}")
         self.validate_btn.setEnabled(True)
 
-    def _on_finished(self, results: list[tuple[str, dict]]) -> None:
-        passes = 0
-        fails = 0
-
-        self.results.appendPlainText("")
-        for fp, res in results:
-            valid = bool(res.get("valid", False))
-            checks = res.get("checks", {}) or {}
-            warnings = res.get("warnings", []) or []
-            errors = res.get("errors", []) or []
-
-            if valid and not errors:
-                passes += 1
-                verdict = "PASS"
-            else:
-                fails += 1
-                verdict = "FAIL"
-
-            self.results.appendPlainText(f"[{verdict}] {fp}")
-            if checks:
-                self.results.appendPlainText("  Checks:")
-                for k, v in _iter_checks_grouped(checks):
-                    self.results.appendPlainText(f"    - {k}: {_format_check_value(k, v)}")
-            if warnings:
-                self.results.appendPlainText("  Warnings:")
-                for w in warnings:
-                    self.results.appendPlainText(f"    - {w}")
-            if errors:
-                self.results.appendPlainText("  Errors:")
-                for e in errors:
-                    self.results.appendPlainText(f"    - {e}")
-            self.results.appendPlainText("")
+    def _on_progress(self, fp: str, res: dict) -> None:
+        # One pre-joined block per package — a single append (one reflow)
+        # as each result streams in, in completion order.
+        valid = bool(res.get("valid", False))
+        checks = res.get("checks", {}) or {}
+        warnings = res.get("warnings", []) or []
+        errors = res.get("errors", []) or []
+
+        verdict = "PASS" if valid and not errors else "FAIL"
+
+        parts: list[str] = [f"[{verdict}] {fp}"]
+        if checks:
+            parts.append("  Checks:")
+            for k, v in _iter_checks_grouped(checks):
+                parts.append(f"    - {k}: {_format_check_value(k, v)}")
+        if warnings:
+            parts.append("  Warnings:")
+            for w in warnings:
+                parts.append(f"    - {w}")
+        if errors:
+            parts.append("  Errors:")
+            for e in errors:
+                parts.append(f"    - {e}")
+        parts.append("")
+
+        self.results.appendPlainText("\n".join(parts))
 
+    def _on_finished(self, payload: object) -> None:
+        passes, fails = payload
         self.status.setText(f"Done. PASS={passes} FAIL={fails}")
         self.validate_btn.setEnabled(True)
 
 
-class ConvertMusicPanel(QtWidgets.QWidget):
+class _PackResultMixin:
+    """Shared worker-result handling for the convert/pack panels.
+
+    Hosts provide ``results`` (QPlainTextEdit), ``status`` (QLabel), a
+    ``_runnable`` slot and a ``_refresh_enabled()`` hook; the payload is the
+    ``(out_path, validation, report)`` tuple the workers emit.
+    """
+
+    def _on_done(self, payload: object, err: str) -> None:
+        self._runnable = None
+        if err:
+            self._on_error(err)
+        else:
+            self._on_finished(payload)
+
+    def _on_error(self, msg: str) -> None:
+        self.results.appendPlainText(f"\nERROR: {msg}")
+        self.status.setText("Failed.")
+        self._refresh_enabled()
+
+    def _on_finished(self, payload: object) -> None:
+        out_path, v, report = payload
+        self.results.setPlainText(report)
+        self.status.setText("Done.")
+        self._refresh_enabled()
+
+
+class ConvertMusicPanel(_PackResultMixin, QtWidgets.QWidget):
     def __init__(self) -> None:
         super().__init__()
-        self._thread: Optional[QtCore.QThread] = None
-        self._worker: Optional[ConvertMusicWorker] = None
+        self._runnable: Optional[ConvertMusicWorker] = None
 
         self.selected_file: Optional[str] = None
+        self._last_browse_dir = ""
 
         layout = QtWidgets.QVBoxLayout(self)
 
         title = QtWidgets.QLabel("Convert → Music (Single Track)")
-        title.setStyleSheet("font-size: 16px; font-weight: 800;")
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
 
         self.drop = DropZone("Drop ONE .wav/.mp3/.flac/.m4a/.ogg here\n(or use Browse)")
@@ -751,7 +967,7 @@ class ConvertMusicPanel(QtWidgets.QWidget):
         self.music_title.setPlaceholderText("Song title (auto-filled from filename)")
 
         self.selected_file_label = QtWidgets.QLabel("")
-        self.selected_file_label.setStyleSheet("opacity: 0.7;")
+        self.selected_file_label.setObjectName("selectedFileLabel")
         self.selected_file_label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
         self.selected_file_label.setMinimumWidth(120)
 
@@ -766,9 +982,7 @@ class ConvertMusicPanel(QtWidgets.QWidget):
             self.cover_path,
             self.music_title,
         ):
-            le.setMinimumWidth(60)
-            le.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
-            le.setClearButtonEnabled(True)
+            _configure_edit(le)
 
         cover_row = QtWidgets.QHBoxLayout()
         cover_row.setContentsMargins(0, 0, 0, 0)
@@ -826,22 +1040,55 @@ class ConvertMusicPanel(QtWidgets.QWidget):
 
         self.results = QtWidgets.QPlainTextEdit()
         self.results.setReadOnly(True)
+        self.results.setUndoRedoEnabled(False)
+        self.results.setMaximumBlockCount(2000)
         layout.addWidget(self.results, 2)
 
         self.status = QtWidgets.QLabel("")
-        self.status.setStyleSheet("opacity: 0.8;")
+        self.status.setObjectName("mutedLabel")
         layout.addWidget(self.status)
 
-        # Gate convert button as fields change
-        self.origin_platform.textChanged.connect(self._refresh_convert_enabled)
-        self.origin_url.textChanged.connect(self._refresh_convert_enabled)
-        self.ai_system.textChanged.connect(self._refresh_convert_enabled)
+        # Gate convert button as fields change; a short single-shot timer
+        # coalesces signal bursts (typing, paste) into one refresh.
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(75)
+        self._refresh_timer.timeout.connect(self._do_refresh_convert_enabled)
+
+        for w in (
+            self.origin_platform,
+            self.origin_url,
+            self.ai_system,
+            self.creator_name,
+            self.creator_email,
+            self.music_title,
+            self.out_path,
+        ):
+            w.textChanged.connect(self._refresh_convert_enabled)
         self.declaration_ack_cb.stateChanged.connect(self._refresh_convert_enabled)
 
-        self.creator_name.textChanged.connect(self._refresh_convert_enabled)
-        self.creator_email.textChanged.connect(self._refresh_convert_enabled)
-        self.music_title.textChanged.connect(self._refresh_convert_enabled)
-        self.out_path.textChanged.connect(self._refresh_convert_enabled)
+        # Required-fields predicate built once; the closure captures the
+        # widgets directly so the per-keystroke path is bound method calls
+        # with no attribute re-resolution.
+        fields = (
+            self.creator_name,
+            self.creator_email,
+            self.music_title,
+            self.origin_platform,
+            self.ai_system,
+            self.out_path,
+        )
+        ack = self.declaration_ack_cb
+
+        def _required_ok() -> bool:
+            if not ack.isChecked():
+                return False
+            for f in fields:
+                if not f.text().strip():
+                    return False
+            return True
+
+        self._required_ok = _required_ok
 
         # ✅ Load defaults once (only fill if empty)
         self.reload_defaults()
@@ -857,39 +1104,44 @@ class ConvertMusicPanel(QtWidgets.QWidget):
 
     def reload_defaults(self) -> None:
         d = load_defaults()
-        # Only fill if empty, so user can override and it works without defaults too
+        # Only fill if empty, so user can override and it works without defaults too.
+        # Block textChanged while filling: one enable-state refresh at the end
+        # instead of one debounce kick per field.
         if not self.creator_name.text().strip():
-            self.creator_name.setText(d.creator_name)
+            with QtCore.QSignalBlocker(self.creator_name):
+                self.creator_name.setText(d.creator_name)
         if not self.creator_email.text().strip():
-            self.creator_email.setText(d.creator_email)
+            with QtCore.QSignalBlocker(self.creator_email):
+                self.creator_email.setText(d.creator_email)
+        self._refresh_convert_enabled()
 
     def _on_drop(self, p: str) -> None:
-        pp = Path(p)
-        if pp.is_dir():
+        if os.path.isdir(p):
             QtWidgets.QMessageBox.information(
                 self, "Single track only",
                 "Music conversion is single-track only. Drop an audio file, not a folder."
             )
             return
 
-        if pp.suffix.lower() not in AUDIO_EXTS:
+        if _ext_of(p) not in AUDIO_EXTS:
             QtWidgets.QMessageBox.information(
                 self, "Unsupported file",
                 "Please drop a supported audio file (.wav/.mp3/.flac/.m4a/.ogg)."
             )
             return
 
-        self.selected_file = str(pp)
-        self.status.setText(f"Selected: {pp.name}")
-        self.selected_file_label.setText(f"({pp.name})")
+        name = os.path.basename(p)
+        self.selected_file = p
+        self.status.setText(f"Selected: {name}")
+        self.selected_file_label.setText(f"({name})")
 
         # Auto-fill title if empty
         if not self.music_title.text().strip():
-            self.music_title.setText(pp.stem)
+            self.music_title.setText(os.path.splitext(name)[0])
 
-        # Auto-suggest output if empty
+        # Auto-suggest output if empty; Path only where the helper needs it
         if not self.out_path.text().strip():
-            self._autofill_out_path_from_selected(pp)
+            self._autofill_out_path_from_selected(Path(p))
 
         self._refresh_convert_enabled()
 
@@ -897,12 +1149,13 @@ class ConvertMusicPanel(QtWidgets.QWidget):
         file, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
             "Select one audio file",
-            str(Path.home()),
-            "Audio Files (*.wav *.mp3 *.flac *.m4a *.ogg)",
+            self._last_browse_dir or _HOME_STR,
+            _AUDIO_FILTER,
         )
         if file:
             self.selected_file = file
             pp = Path(file)
+            self._last_browse_dir = str(pp.parent)
             self.status.setText(f"Selected: {pp.name}")
             self.selected_file_label.setText(f"({pp.name})")
 
@@ -918,24 +1171,27 @@ class ConvertMusicPanel(QtWidgets.QWidget):
         file, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
             "Select cover image (optional)",
-            str(Path.home()),
-            "Images (*.png *.jpg *.jpeg *.webp)",
+            self._last_browse_dir or _HOME_STR,
+            _COVER_FILTER,
         )
         if file:
             self.cover_path.setText(file)
+            self._last_browse_dir = _safe_parent_dir(file)
 
     def _browse_out_aifm(self) -> None:
         d = load_defaults()
-        start_dir = str(Path.home())
+        start_dir = _HOME_STR
 
         try:
             cur = self.out_path.text().strip()
             if cur:
-                start_dir = str(Path(cur).expanduser().resolve().parent)
-            elif getattr(d, "default_output_dir", ""):
-                start_dir = str(Path(d.default_output_dir).expanduser().resolve())
+                start_dir = _safe_parent_dir(cur)
+            elif d.default_output_dir:
+                # expanduser only — resolve() would stat every path component
+                # just to seed a dialog location
+                start_dir = str(Path(d.default_output_dir).expanduser())
             elif self.selected_file:
-                start_dir = str(Path(self.selected_file).expanduser().resolve().parent)
+                start_dir = _safe_parent_dir(self.selected_file)
         except Exception:
             pass
 
@@ -952,10 +1208,10 @@ class ConvertMusicPanel(QtWidgets.QWidget):
             self,
             "Save AIFM package as…",
             str(Path(start_dir) / default_name),
-            "AIFM Package (*.aifm);;All files (*)",
+            _AIFM_FILTER,
         )
         if fp:
-            if not fp.lower().endswith(".aifm"):
+            if _ext_of(fp) != ".aifm":
                 fp += ".aifm"
             self.out_path.setText(fp)
             self._refresh_convert_enabled()
@@ -964,7 +1220,7 @@ class ConvertMusicPanel(QtWidgets.QWidget):
         d = load_defaults()
         base_dir = None
         try:
-            if getattr(d, "default_output_dir", ""):
+            if d.default_output_dir:
                 base_dir = Path(d.default_output_dir).expanduser()
         except Exception:
             base_dir = None
@@ -976,20 +1232,10 @@ class ConvertMusicPanel(QtWidgets.QWidget):
         self.out_path.setText(str((base_dir / f"{title}.aifm").resolve()))
 
     def _refresh_convert_enabled(self) -> None:
-        has_file = bool(self.selected_file)
-
-        creator_ok = bool(self.creator_name.text().strip()) and bool(self.creator_email.text().strip())
-
-        req_ok = (
-            bool(self.music_title.text().strip())
-            and bool(self.origin_platform.text().strip())
-            and bool(self.ai_system.text().strip())
-        )
-
-        out_ok = bool(self.out_path.text().strip())
-        confirmed = self.declaration_ack_cb.isChecked()
+        self._refresh_timer.start()
 
-        self.convert_btn.setEnabled(bool(has_file and creator_ok and req_ok and out_ok and confirmed))
+    def _do_refresh_convert_enabled(self) -> None:
+        self.convert_btn.setEnabled(bool(self.selected_file) and self._required_ok())
 
     def run_convert(self) -> None:
         if not self.selected_file:
@@ -1030,68 +1276,34 @@ class ConvertMusicPanel(QtWidgets.QWidget):
             cover_image_path=cover_path,
         )
 
-        self.results.clear()
-        self.results.appendPlainText("Converting to .aifm…")
+        self.results.setPlainText("Converting to .aifm…")
         self.convert_btn.setEnabled(False)
 
-        self._thread = QtCore.QThread(self)
-        self._worker = ConvertMusicWorker(inp, str(out_path))
-        self._worker.moveToThread(self._thread)
-
-        self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self._on_finished)
-        self._worker.error.connect(self._on_error)
-
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.finished.connect(self._worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
-
-        self._worker.error.connect(self._thread.quit)
-        self._worker.error.connect(self._worker.deleteLater)
-
-        self._thread.start()
+        self._runnable = ConvertMusicWorker(inp, str(out_path))
+        self._runnable.signals.done.connect(
+            self._on_done, QtCore.Qt.QueuedConnection
+        )
+        QtCore.QThreadPool.globalInstance().start(self._runnable)
 
-    def _on_error(self, msg: str) -> None:
-        self.results.appendPlainText("")
-        self.results.appendPlainText(f"ERROR: {msg}")
+    def _refresh_enabled(self) -> None:
+        # Mixin hook — this panel's debounced refresh has its own name.
         self._refresh_convert_enabled()
 
-    def _on_finished(self, payload: object) -> None:
-        out_path, v = payload
-
-        self.results.appendPlainText("")
-        self.results.appendPlainText(f"[OK] Wrote: {out_path}")
-
-        valid = bool(v.get("valid", False))
-        errs = v.get("errors", []) or []
-        warns = v.get("warnings", []) or []
-        checks = v.get("checks", {}) or {}
 
-        self.results.appendPlainText("")
-        self.results.appendPlainText(f"Post-validate: {'PASS' if valid and not errs else 'FAIL'}")
-        if checks:
-            self.results.appendPlainText("Checks:")
-            for k, vv in _iter_checks_grouped(checks):
-                self.results.appendPlainText(f"  - {k}: {_format_check_value(k, vv)}")
-        if warns:
-            self.results.appendPlainText("Warnings:")
-            for w in warns:
-                self.results.appendPlainText(f"  - {w}")
-        if errs:
-            self.results.appendPlainText("Errors:")
-            for e in errs:
-                self.results.appendPlainText(f"  - {e}")
-
-        self.status.setText("Done.")
-        self._refresh_convert_enabled()
-
-class PackAIFVPanel(QtWidgets.QWidget):
+class PackAIFVPanel(_PackResultMixin, QtWidgets.QWidget):
     def __init__(self, defaults: AppDefaults) -> None:
         super().__init__()
-        self._defaults = defaults
-        self._thread: Optional[QtCore.QThread] = None
-        self._worker: Optional[PackAIFVWorker] = None
+        # One layout/style pass at the end instead of one per addWidget/addRow
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui(defaults)
+        finally:
+            self.setUpdatesEnabled(True)
 
+    def _build_ui(self, defaults: AppDefaults) -> None:
+        self._runnable: Optional[PackAIFVWorker] = None
+
+        self._last_browse_dir = ""
         self.video_path: Optional[str] = None
         self.thumb_path: Optional[str] = None
 
@@ -1101,7 +1313,7 @@ class PackAIFVPanel(QtWidgets.QWidget):
         layout.setContentsMargins(12, 12, 12, 12)
 
         title = QtWidgets.QLabel("Package → Video (AIFV)")
-        title.setStyleSheet("font-size: 16px; font-weight: 800;")
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
 
         # --- Pickers row
@@ -1157,6 +1369,13 @@ class PackAIFVPanel(QtWidgets.QWidget):
         self.work_title = QtWidgets.QLineEdit()
         self.creator_name = QtWidgets.QLineEdit(defaults.creator_name)
         self.creator_contact = QtWidgets.QLineEdit(defaults.creator_email)
+
+        # Widgets refreshed from AppDefaults on defaultsSaved
+        self._default_bindings: list[tuple[QtWidgets.QLineEdit, str]] = [
+            (self.creator_name, "creator_name"),
+            (self.creator_contact, "creator_email"),
+        ]
+
         self.primary_tool = QtWidgets.QLineEdit()
         self.primary_tool_version = QtWidgets.QLineEdit()
         self.supporting_tools = QtWidgets.QLineEdit()
@@ -1220,6 +1439,8 @@ class PackAIFVPanel(QtWidgets.QWidget):
         self.results = QtWidgets.QPlainTextEdit()
         self.results.setReadOnly(True)
         self.results.setLineWrapMode(QtWidgets.QPlainTextEdit.WidgetWidth)
+        self.results.setUndoRedoEnabled(False)
+        self.results.setMaximumBlockCount(2000)
 
         fm = self.results.fontMetrics()
         h = (fm.lineSpacing() * 5) + 16  # ~5 lines
@@ -1230,9 +1451,19 @@ class PackAIFVPanel(QtWidgets.QWidget):
 
         layout.addWidget(self.results)
 
-        self._refresh_enabled()
+        self.status = QtWidgets.QLabel("")
+        self.status.setObjectName("mutedLabel")
+        layout.addWidget(self.status)
+
+        # Live refresh, coalesced per input burst (same timer pattern as
+        # ConvertMusicPanel); the first evaluation runs directly so the
+        # Package button starts in the right state.
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_refresh_enabled)
+        self._do_refresh_enabled()
 
-        # Live refresh
         self.work_title.textChanged.connect(self._refresh_enabled)
         self.creator_name.textChanged.connect(self._refresh_enabled)
         self.creator_contact.textChanged.connect(self._refresh_enabled)
@@ -1242,43 +1473,42 @@ class PackAIFVPanel(QtWidgets.QWidget):
 
     def reload_defaults(self) -> None:
         d = load_defaults()
-
-        # If you have these fields in the panel, populate them.
-        # Adjust names to match your widgets.
-        if hasattr(self, "creator_name"):
-            self.creator_name.setText(d.creator_name)
-        if hasattr(self, "creator_email"):
-            self.creator_email.setText(d.creator_email)
-        if hasattr(self, "output_dir"):
-            self.output_dir.setText(d.default_output_dir)
+        # Fill silently, then refresh once rather than per bound field.
+        for w, attr in self._default_bindings:
+            with QtCore.QSignalBlocker(w):
+                w.setText(getattr(d, attr, ""))
+        self._refresh_enabled()
 
     def _browse_video(self) -> None:
         fp, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Select video", str(Path.home()), "Video (*.mp4 *.mov *.webm *.m4v);;All files (*)"
+            self, "Select video", self._last_browse_dir or _HOME_STR, _VIDEO_FILTER
         )
         if fp:
             self.video_path = fp
             self.video_path_lbl.setText(fp)
+            self._last_browse_dir = _safe_parent_dir(fp)
             self._refresh_enabled()
 
     def _browse_thumb(self) -> None:
         fp, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Select thumbnail", str(Path.home()), "Image (*.jpg *.jpeg *.png *.webp);;All files (*)"
+            self, "Select thumbnail", self._last_browse_dir or _HOME_STR, _THUMB_FILTER
         )
         if fp:
             self.thumb_path = fp
             self.thumb_path_lbl.setText(fp)
+            self._last_browse_dir = _safe_parent_dir(fp)
             self._refresh_enabled()
 
     def _browse_out(self) -> None:
         # Default directory: whatever is in the box, else defaults output dir, else home
-        start_dir = str(Path.home())
+        start_dir = _HOME_STR
         try:
             cur = self.out_path.text().strip()
+            d = load_defaults()
             if cur:
-                start_dir = str(Path(cur).expanduser().resolve().parent)
-            elif hasattr(self, "_defaults") and getattr(self._defaults, "default_output_dir", ""):
-                start_dir = str(Path(self._defaults.default_output_dir).expanduser().resolve())
+                start_dir = _safe_parent_dir(cur)
+            elif d.default_output_dir:
+                start_dir = str(Path(d.default_output_dir).expanduser())
         except Exception:
             pass
 
@@ -1286,15 +1516,18 @@ class PackAIFVPanel(QtWidgets.QWidget):
             self,
             "Save AIFV package as…",
             str(Path(start_dir) / "video.aifv"),
-            "AIFV Package (*.aifv);;All files (*)",
+            _AIFV_FILTER,
         )  
         if fp:
-            if not fp.lower().endswith(".aifv"):
+            if _ext_of(fp) != ".aifv":
                 fp += ".aifv"
             self.out_path.setText(fp)
             self._refresh_enabled()
 
     def _refresh_enabled(self) -> None:
+        self._refresh_timer.start()
+
+    def _do_refresh_enabled(self) -> None:
         ok = True
         ok = ok and bool(self.video_path)
         ok = ok and bool(self.thumb_path)
@@ -1307,14 +1540,12 @@ class PackAIFVPanel(QtWidgets.QWidget):
         self.pack_btn.setEnabled(ok)
 
     def run_pack(self) -> None:
-        self.results.clear()
-        self.results.appendPlainText("Packaging to .aifv…")
+        self.results.setPlainText("Packaging to .aifv…")
         self.pack_btn.setEnabled(False)
 
         outp = _abs(self.out_path.text().strip())
 
-        self._thread = QtCore.QThread(self)
-        self._worker = PackAIFVWorker(
+        self._runnable = PackAIFVWorker(
             video_path=str(self.video_path),
             thumb_path=str(self.thumb_path),
             out_path=outp,
@@ -1324,80 +1555,35 @@ class PackAIFVPanel(QtWidgets.QWidget):
             mode="human-directed-ai",
             primary_tool=self.primary_tool.text().strip(),
             primary_tool_version=self.primary_tool_version.text().strip(),
-            supporting_tools=[
-                n.strip()
-                for n in self.supporting_tools.text().split(",")
-                if n.strip()
-            ][:3],
+            supporting_tools=_split_supporting_tools(self.supporting_tools.text()),
             origin_url=self.origin_url.text().strip(),
         )
-        self._worker.moveToThread(self._thread)
-
-        self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self._on_finished)
-        self._worker.error.connect(self._on_error)
-
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.finished.connect(self._worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
-
-        self._worker.error.connect(self._thread.quit)
-        self._worker.error.connect(self._worker.deleteLater)
-
-        self._thread.start()
-
-    def _on_error(self, msg: str) -> None:
-        self.results.appendPlainText("")
-        self.results.appendPlainText(f"ERROR: {msg}")
-        self.status.setText("Failed.")
-        self._refresh_enabled()
-
-    def _on_finished(self, payload: object) -> None:
-        out_path, v = payload
-
-        self.results.appendPlainText("")
-        self.results.appendPlainText(f"[OK] Wrote: {out_path}")
-
-        valid = bool(v.get("valid", False))
-        errs = v.get("errors", []) or []
-        warns = v.get("warnings", []) or []
-        checks = v.get("checks", {}) or {}
-
-        self.results.appendPlainText("")
-        self.results.appendPlainText(f"Post-validate: {'PASS' if valid and not errs else 'FAIL'}")
-
-        if checks:
-            self.results.appendPlainText("Checks:")
-            for k, vv in _iter_checks_grouped(checks):
-                self.results.appendPlainText(f"  - {k}: {_format_check_value(k, vv)}")
-
-        if warns:
-            self.results.appendPlainText("Warnings:")
-            for w in warns:
-                self.results.appendPlainText(f"  - {w}")
-
-        if errs:
-            self.results.appendPlainText("Errors:")
-            for e in errs:
-                self.results.appendPlainText(f"  - {e}")
-
-        self.status.setText("Done.")
-        self._refresh_enabled()
+        self._runnable.signals.done.connect(
+            self._on_done, QtCore.Qt.QueuedConnection
+        )
+        QtCore.QThreadPool.globalInstance().start(self._runnable)
 
-class PackAIFIPanel(QtWidgets.QWidget):
+class PackAIFIPanel(_PackResultMixin, QtWidgets.QWidget):
     def __init__(self, defaults: AppDefaults) -> None:
         super().__init__()
-        self._defaults = defaults
-        self._thread: Optional[QtCore.QThread] = None
-        self._worker: Optional[PackAIFIWorker] = None
+        # One layout/style pass at the end instead of one per addWidget/addRow
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui(defaults)
+        finally:
+            self.setUpdatesEnabled(True)
 
+    def _build_ui(self, defaults: AppDefaults) -> None:
+        self._runnable: Optional[PackAIFIRunnable] = None
+
+        self._last_browse_dir = ""
         self.image_path: Optional[str] = None
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setAlignment(QtCore.Qt.AlignTop)
 
         title = QtWidgets.QLabel("Package → Image (AIFI)")
-        title.setStyleSheet("font-size: 16px; font-weight: 800;")
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
 
         pick_row = QtWidgets.QGridLayout()
@@ -1479,6 +1665,8 @@ class PackAIFIPanel(QtWidgets.QWidget):
 
         self.results = QtWidgets.QPlainTextEdit()
         self.results.setReadOnly(True)
+        self.results.setUndoRedoEnabled(False)
+        self.results.setMaximumBlockCount(2000)
         self.results.setMinimumHeight(150)
         self.results.setMaximumHeight(220)
         self.results.setSizePolicy(QtWidgets.QSizePolicy.Expanding,
@@ -1486,76 +1674,105 @@ class PackAIFIPanel(QtWidgets.QWidget):
         layout.addWidget(self.results)
 
         self.status = QtWidgets.QLabel("")
-        self.status.setStyleSheet("opacity: 0.85;")
+        self.status.setObjectName("mutedLabel")
         layout.addWidget(self.status)
 
-        self.work_title.textChanged.connect(self._refresh_enabled)
-        self.creator_name.textChanged.connect(self._refresh_enabled)
-        self.creator_contact.textChanged.connect(self._refresh_enabled)
-        self.primary_tool.textChanged.connect(self._refresh_enabled)
-        self.out_path.textChanged.connect(self._refresh_enabled)
+        self._required_fields = (
+            self.work_title,
+            self.creator_name,
+            self.creator_contact,
+            self.primary_tool,
+            self.out_path,
+        )
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_refresh_enabled)
+
+        for w in self._required_fields:
+            w.textChanged.connect(self._refresh_enabled)
         self.declaration_ack_cb.stateChanged.connect(self._refresh_enabled)
-        self._refresh_enabled()
+        self._do_refresh_enabled()
 
     def reload_defaults(self) -> None:
         d = load_defaults()
-        self.creator_name.setText(d.creator_name)
-        self.creator_contact.setText(d.creator_email)
+        with QtCore.QSignalBlocker(self.creator_name):
+            self.creator_name.setText(d.creator_name)
+        with QtCore.QSignalBlocker(self.creator_contact):
+            self.creator_contact.setText(d.creator_email)
+        self._refresh_enabled()
 
     def _browse_image(self) -> None:
-        fp, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Select image", str(Path.home()), "Image (*.png *.jpg *.jpeg *.webp);;All files (*)"
+        # Non-modal: open() keeps the event loop pumping while the native
+        # dialog is up (getOpenFileName blocks the GUI thread).
+        dlg = QtWidgets.QFileDialog(
+            self, "Select image", self._last_browse_dir or _HOME_STR, _IMAGE_FILTER
         )
-        if fp:
-            self.image_path = fp
-            self.image_path_lbl.setText(fp)
-            if not self.work_title.text().strip():
-                self.work_title.setText(Path(fp).stem)
-            self._refresh_enabled()
+        dlg.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+        dlg.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        dlg.fileSelected.connect(self._on_image_chosen)
+        dlg.open()
+
+    def _on_image_chosen(self, fp: str) -> None:
+        if not fp:
+            return
+        self.image_path = fp
+        self.image_path_lbl.setText(fp)
+        self._last_browse_dir = _safe_parent_dir(fp)
+        if not self.work_title.text().strip():
+            self.work_title.setText(Path(fp).stem)
+        self._refresh_enabled()
 
     def _browse_out(self) -> None:
-        start_dir = str(Path.home())
+        start_dir = _HOME_STR
         try:
             cur = self.out_path.text().strip()
+            d = load_defaults()
             if cur:
-                start_dir = str(Path(cur).expanduser().resolve().parent)
+                start_dir = _safe_parent_dir(cur)
             elif self.image_path:
-                start_dir = str(Path(self.image_path).expanduser().resolve().parent)
-            elif self._defaults.default_output_dir:
-                start_dir = str(Path(self._defaults.default_output_dir).expanduser().resolve())
+                start_dir = _safe_parent_dir(self.image_path)
+            elif d.default_output_dir:
+                start_dir = str(Path(d.default_output_dir).expanduser())
         except Exception:
             pass
 
-        fp, _ = QtWidgets.QFileDialog.getSaveFileName(
+        dlg = QtWidgets.QFileDialog(
             self,
             "Save AIFI package as…",
             str(Path(start_dir) / "image.aifi"),
-            "AIFI Package (*.aifi);;All files (*)",
+            _AIFI_FILTER,
         )
-        if fp:
-            if not fp.lower().endswith(".aifi"):
-                fp += ".aifi"
-            self.out_path.setText(fp)
-            self._refresh_enabled()
+        dlg.setAcceptMode(QtWidgets.QFileDialog.AcceptSave)
+        dlg.setFileMode(QtWidgets.QFileDialog.AnyFile)
+        dlg.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        dlg.fileSelected.connect(self._on_out_chosen)
+        dlg.open()
+
+    def _on_out_chosen(self, fp: str) -> None:
+        if not fp:
+            return
+        if _ext_of(fp) != ".aifi":
+            fp += ".aifi"
+        self.out_path.setText(fp)
+        self._refresh_enabled()
 
     def _refresh_enabled(self) -> None:
-        ok = True
-        ok = ok and bool(self.image_path)
-        ok = ok and bool(self.work_title.text().strip())
-        ok = ok and bool(self.creator_name.text().strip())
-        ok = ok and bool(self.creator_contact.text().strip())
-        ok = ok and bool(self.primary_tool.text().strip())
-        ok = ok and bool(self.out_path.text().strip())
-        ok = ok and self.declaration_ack_cb.isChecked()
+        self._refresh_timer.start()
+
+    def _do_refresh_enabled(self) -> None:
+        ok = (
+            bool(self.image_path)
+            and all(w.text().strip() for w in self._required_fields)
+            and self.declaration_ack_cb.isChecked()
+        )
         self.pack_btn.setEnabled(ok)
 
     def run_pack(self) -> None:
-        self.results.clear()
-        self.results.appendPlainText("Packaging to .aifi…")
+        self.results.setPlainText("Packaging to .aifi…")
         self.pack_btn.setEnabled(False)
 
-        self._thread = QtCore.QThread(self)
-        self._worker = PackAIFIWorker(
+        self._runnable = PackAIFIRunnable(
             image_path=str(self.image_path),
             out_path=_abs(self.out_path.text().strip()),
             title=self.work_title.text().strip(),
@@ -1563,71 +1780,22 @@ class PackAIFIPanel(QtWidgets.QWidget):
             creator_contact=self.creator_contact.text().strip(),
             mode="human-directed-ai",
             primary_tool=self.primary_tool.text().strip(),
-            supporting_tools=[
-                n.strip()
-                for n in self.supporting_tools.text().split(",")
-                if n.strip()
-            ][:3],
+            supporting_tools=_split_supporting_tools(self.supporting_tools.text()),
         )
-        self._worker.moveToThread(self._thread)
-
-        self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self._on_finished)
-        self._worker.error.connect(self._on_error)
-
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.finished.connect(self._worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
-        self._worker.error.connect(self._thread.quit)
-        self._worker.error.connect(self._worker.deleteLater)
-
-        self._thread.start()
-
-    def _on_error(self, msg: str) -> None:
-        self.results.appendPlainText("")
-        self.results.appendPlainText(f"ERROR: {msg}")
-        self.status.setText("Failed.")
-        self._refresh_enabled()
-
-    def _on_finished(self, payload: object) -> None:
-        out_path, v = payload
-
-        self.results.appendPlainText("")
-        self.results.appendPlainText(f"[OK] Wrote: {out_path}")
-
-        valid = bool(v.get("valid", False))
-        errs = v.get("errors", []) or []
-        warns = v.get("warnings", []) or []
-        checks = v.get("checks", {}) or {}
-
-        self.results.appendPlainText("")
-        self.results.appendPlainText(f"Post-validate: {'PASS' if valid and not errs else 'FAIL'}")
-        if checks:
-            self.results.appendPlainText("Checks:")
-            for k, vv in _iter_checks_grouped(checks):
-                self.results.appendPlainText(f"  - {k}: {_format_check_value(k, vv)}")
-        if warns:
-            self.results.appendPlainText("Warnings:")
-            for w in warns:
-                self.results.appendPlainText(f"  - {w}")
-        if errs:
-            self.results.appendPlainText("Errors:")
-            for e in errs:
-                self.results.appendPlainText(f"  - {e}")
-
-        self.status.setText("Done.")
-        self._refresh_enabled()
-
+        self._runnable.signals.done.connect(
+            self._on_done, QtCore.Qt.QueuedConnection
+        )
+        QtCore.QThreadPool.globalInstance().start(self._runnable)
 
 class PlaceholderPanel(QtWidgets.QWidget):
     def __init__(self, title_text: str, note: str) -> None:
         super().__init__()
         layout = QtWidgets.QVBoxLayout(self)
         title = QtWidgets.QLabel(title_text)
-        title.setStyleSheet("font-size: 16px; font-weight: 800;")
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
         msg = QtWidgets.QLabel(note)
-        msg.setStyleSheet("opacity: 0.85;")
+        msg.setObjectName("mutedLabel")
         msg.setWordWrap(True)
         layout.addWidget(msg)
         layout.addStretch(1)
@@ -1636,13 +1804,194 @@ class PlaceholderPanel(QtWidgets.QWidget):
 # -----------------------------
 # Main Window
 # -----------------------------
+
+# Built once at import; installed application-wide in main() so Qt parses the
+# sheet a single time instead of per window.
+_APP_QSS = """
+/* Buttons (Browse, Save, Validate, etc.) */
+QPushButton {
+    background: #3b3b3b;
+    color: #f0f0f0;
+    border: 1px solid rgba(255,255,255,0.25);
+    border-radius: 10px;
+    padding: 8px 12px;
+}
+QPushButton:hover {
+    background: #454545;
+    border: 1px solid rgba(255,255,255,0.35);
+}
+QPushButton:pressed {
+    background: #2f2f2f;
+    border: 1px solid rgba(255,255,255,0.30);
+}
+QPushButton:disabled {
+    background: #262626;
+    color: rgba(255,255,255,0.40);
+    border: 1px solid rgba(255,255,255,0.12);
+}
+
+/* Inputs — tagged via _tag_inputs() so one property match covers all three types */
+*[class="aifxInput"] {
+    background: #262626;
+    color: #f2f2f2;
+    border: 1px solid rgba(255,255,255,0.18);
+    border-radius: 8px;
+
+    /* macOS: 6px vertical padding can clip text */
+    padding: 4px 8px;
+}
+
+/* Give QLineEdit a stable height so text is never clipped */
+QLineEdit {
+    min-height: 26px;
+}
+
+*[class="aifxInput"]:focus {
+    border: 1px solid rgba(255,255,255,0.32);
+}
+
+/* Sidebar navigation — indent values match SidebarButton(indent=...) */
+QPushButton#SidebarButton {
+    text-align: left;
+    padding: 10px 12px;
+    padding-left: 12px;
+    border: 1px solid transparent;
+    border-radius: 10px;
+    background: transparent;
+    color: rgba(255, 255, 255, 0.88);
+}
+QPushButton#SidebarButton[indent="14"] {
+    padding-left: 26px;
+}
+QPushButton#SidebarButton:hover {
+    background: rgba(255, 255, 255, 0.06);
+    border: 1px solid rgba(255, 255, 255, 0.10);
+}
+QPushButton#SidebarButton:checked {
+    font-weight: 800;
+    color: #ffffff;
+    border: 1px solid rgba(255, 255, 255, 0.22);
+
+    /* "metallic" highlight */
+    background: qlineargradient(
+        x1:0, y1:0, x2:0, y2:1,
+        stop:0 rgba(255,255,255,0.22),
+        stop:0.45 rgba(255,255,255,0.12),
+        stop:1 rgba(0,0,0,0.18)
+    );
+}
+QPushButton#SidebarButton:checked:hover {
+    border: 1px solid rgba(255, 255, 255, 0.30);
+    background: qlineargradient(
+        x1:0, y1:0, x2:0, y2:1,
+        stop:0 rgba(255,255,255,0.26),
+        stop:0.45 rgba(255,255,255,0.14),
+        stop:1 rgba(0,0,0,0.20)
+    );
+}
+
+/* Right-click menu */
+QMenu {
+    background: #2b2b2b;
+    color: #f2f2f2;
+    border: 1px solid rgba(255,255,255,0.25);
+    padding: 6px;
+}
+QMenu::item {
+    padding: 6px 24px 6px 18px;
+    background: transparent;
+}
+QMenu::item:selected {
+    background: rgba(255,255,255,0.14);
+}
+
+/* Page container chrome stays transparent over the window background */
+QScrollArea, QStackedWidget {
+    background: transparent;
+}
+
+/* Labels — objectName selectors replace per-widget setStyleSheet calls,
+   so the app sheet is parsed once instead of per label */
+QLabel#homeTitle {
+    font-size: 20px;
+    font-weight: 900;
+}
+QLabel#panelTitle {
+    font-size: 16px;
+    font-weight: 800;
+}
+QLabel#homeBody {
+    font-size: 13px;
+    opacity: 0.95;
+}
+QLabel#mutedLabel {
+    opacity: 0.8;
+}
+QLabel#selectedFileLabel {
+    opacity: 0.7;
+}
+QLabel#convertHeader {
+    font-weight: 800;
+    color: #888;
+    padding: 6px 12px;
+}
+"""
+
+
+# Content-frame sheets swapped by MainWindow._set_content_style; module
+# constants so the strings are built once, not per navigation.
+_QSS_ACTIVE = """
+QFrame#contentFrame {
+    background: qlineargradient(
+        x1:0, y1:0, x2:0, y2:1,
+        stop:0 #3b3b3b,
+        stop:1 #2e2e2e
+    );
+    border-radius: 10px;
+}
+
+/* Light satin inputs on dark metal */
+*[class="aifxInput"] {
+       background: #555;
+       color: #ffffff;
+       border: 1px solid #6a6a6a;
+       border-radius: 6px;
+       padding: 6px 8px;
+}
+
+*[class="aifxInput"]:focus {
+    background: #606060;
+    border: 1px solid #9a9a9a;
+}
+
+*[class="aifxInput"]::placeholder {
+    color: rgba(255, 255, 255, 0.55);
+}
+"""
+
+_QSS_NEUTRAL = """
+QFrame#contentFrame {
+    background: #2b2b2b;
+    border-radius: 10px;
+}
+
+*[class="aifxInput"] {
+    background: #444;
+    color: #eee;
+    border: 1px solid #555;
+    border-radius: 6px;
+    padding: 6px 8px;
+}
+"""
+
+
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self) -> None:
         super().__init__()
+        self._style_active: Optional[bool] = None
 
         # Background image (window-level, cross-platform safe)
-        bg = resource_path("ui/desktop/assets/aifxbackground.png")
-        pm = QtGui.QPixmap(bg)
+        pm = _background_pixmap()
         if not pm.isNull():
             pal = self.palette()
             pal.setBrush(QtGui.QPalette.Window, QtGui.QBrush(pm))
@@ -1650,65 +1999,8 @@ class MainWindow(QtWidgets.QMainWindow):
             self.setPalette(pal)
 
         self.setWindowTitle("AIFX Desktop (v0) — Converter + Validator")
+        self.setWindowIcon(_app_icon())
         self.resize(980, 640)
-        self.setStyleSheet("""
-        /* Buttons (Browse, Save, Validate, etc.) */
-        QPushButton {
-            background: #3b3b3b;
-            color: #f0f0f0;
-            border: 1px solid rgba(255,255,255,0.25);
-            border-radius: 10px;
-            padding: 8px 12px;
-        }
-        QPushButton:hover {
-            background: #454545;
-            border: 1px solid rgba(255,255,255,0.35);
-        }
-        QPushButton:pressed {
-            background: #2f2f2f;
-            border: 1px solid rgba(255,255,255,0.30);
-        }
-        QPushButton:disabled {
-            background: #262626;
-            color: rgba(255,255,255,0.40);
-            border: 1px solid rgba(255,255,255,0.12);
-        }
-
-        /* Inputs */
-        QLineEdit, QTextEdit, QPlainTextEdit {
-            background: #262626;
-            color: #f2f2f2;
-            border: 1px solid rgba(255,255,255,0.18);
-            border-radius: 8px;
-
-            /* macOS: 6px vertical padding can clip text */
-            padding: 4px 8px;
-        }
-
-        /* Give QLineEdit a stable height so text is never clipped */
-        QLineEdit {
-            min-height: 26px;
-        }
-
-        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {
-            border: 1px solid rgba(255,255,255,0.32);
-        }
-
-        /* Right-click menu */
-        QMenu {
-            background: #2b2b2b;
-            color: #f2f2f2;
-            border: 1px solid rgba(255,255,255,0.25);
-            padding: 6px;
-        }
-        QMenu::item {
-            padding: 6px 24px 6px 18px;
-            background: transparent;
-        }
-        QMenu::item:selected {
-            background: rgba(255,255,255,0.14);
-        }
-        """)
 
         central = QtWidgets.QWidget()
         self.setCentralWidget(central)
@@ -1723,58 +2015,56 @@ class MainWindow(QtWidgets.QMainWindow):
         side.setContentsMargins(10, 10, 10, 10)
         side.setSpacing(6)
 
-        title = QtWidgets.QLabel("AIFX Desktop")
-        title.setStyleSheet("font-size: 16px; font-weight: 800;")
-        side.addWidget(title)
-        side.addSpacing(8)
-
-        self.btn_home = SidebarButton("Home")
-        self.btn_defaults = SidebarButton("Defaults")
-        self.btn_validate = SidebarButton("Validate")
-
-        self.lbl_convert = QtWidgets.QLabel("Convert")
-        self.lbl_convert.setStyleSheet("font-weight: 800; color: #888; padding: 6px 12px;")
-
-        self.btn_music = SidebarButton("Music", indent=14)
-        self.btn_video = SidebarButton("Video", indent=14)
-        self.btn_image = SidebarButton("Image", indent=14)
-        self.btn_project = SidebarButton("Project", indent=14)
-
-        side.addWidget(self.btn_home)
-        side.addWidget(self.btn_defaults)
-        side.addWidget(self.btn_validate)
-        side.addSpacing(6)
-        side.addWidget(self.lbl_convert)
-        side.addWidget(self.btn_music)
-        side.addWidget(self.btn_video)
-        side.addWidget(self.btn_image)
-        side.addWidget(self.btn_project)
-        side.addStretch(1)
-
-        # Pages
+        # Populate in one layout pass (same guard the pack panels use)
+        sidebar.setUpdatesEnabled(False)
+        try:
+            title = QtWidgets.QLabel("AIFX Desktop")
+            title.setObjectName("panelTitle")
+            side.addWidget(title)
+            side.addSpacing(8)
+
+            self.btn_home = SidebarButton("Home")
+            self.btn_defaults = SidebarButton("Defaults")
+            self.btn_validate = SidebarButton("Validate")
+
+            self.lbl_convert = QtWidgets.QLabel("Convert")
+            self.lbl_convert.setObjectName("convertHeader")
+
+            self.btn_music = SidebarButton("Music", indent=14)
+            self.btn_video = SidebarButton("Video", indent=14)
+            self.btn_image = SidebarButton("Image", indent=14)
+            self.btn_project = SidebarButton("Project", indent=14)
+
+            side.addWidget(self.btn_home)
+            side.addWidget(self.btn_defaults)
+            side.addWidget(self.btn_validate)
+            side.addSpacing(6)
+            side.addWidget(self.lbl_convert)
+            side.addWidget(self.btn_music)
+            side.addWidget(self.btn_video)
+            side.addWidget(self.btn_image)
+            side.addWidget(self.btn_project)
+            side.addStretch(1)
+        finally:
+            sidebar.setUpdatesEnabled(True)
+
+        # Pages — built lazily on first navigation so cold start only pays
+        # for the landing page (see _ensure_page).
         self.pages = QtWidgets.QStackedWidget()
 
-        defaults = load_defaults()
-
-        self.page_home = HomePanel()
-        self.page_defaults = DefaultsPanel()
-        self.page_validate = ValidatePanel()
-        self.page_music = ConvertMusicPanel()
-        self.page_video = PackAIFVPanel(defaults)
-        self.page_image = PackAIFIPanel(defaults)
-
-        self.page_project = PlaceholderPanel(
-            "Convert → Project",
-            "Not implemented yet. AIFP packaging rules need design (entry point, include/exclude).",
-        )
-
-        self.pages.addWidget(self.page_home)      # 0
-        self.pages.addWidget(self.page_defaults)  # 1
-        self.pages.addWidget(self.page_validate)  # 2
-        self.pages.addWidget(self.page_music)     # 3
-        self.pages.addWidget(self.page_video)     # 4
-        self.pages.addWidget(self.page_image)     # 5
-        self.pages.addWidget(self.page_project)   # 6
+        self._page_factories: dict[int, Any] = {
+            0: HomePanel,
+            1: DefaultsPanel,
+            2: ValidatePanel,
+            3: ConvertMusicPanel,
+            4: lambda: PackAIFVPanel(load_defaults()),
+            5: lambda: PackAIFIPanel(load_defaults()),
+            6: lambda: PlaceholderPanel(
+                "Convert → Project",
+                "Not implemented yet. AIFP packaging rules need design (entry point, include/exclude).",
+            ),
+        }
+        self._page_cache: dict[int, QtWidgets.QWidget] = {}
 
         root.addWidget(sidebar)
 
@@ -1783,18 +2073,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.scroll.setWidgetResizable(True)
         self.scroll.setFrameShape(QtWidgets.QFrame.NoFrame)
         self.scroll.setWidget(self.pages)
-        self.scroll.setStyleSheet("background: transparent;")
-        self.pages.setStyleSheet("background: transparent;")
 
         # Content frame (gives us a background panel we can style)
         self.content_frame = QtWidgets.QFrame()
         self.content_frame.setObjectName("contentFrame")
-        self.content_frame.setStyleSheet("""
-        QFrame#contentFrame {
-            background-color: rgba(45, 45, 45, 220);
-            border-radius: 12px;
-        }
-        """)
 
         content_layout = QtWidgets.QVBoxLayout(self.content_frame)
         content_layout.setContentsMargins(0, 0, 0, 0)
@@ -1802,12 +2084,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
         root.addWidget(self.content_frame, 1)
 
-        self.content_frame.setStyleSheet("""
-        QFrame#contentFrame {
-            background: #3a3a3a;
-            border-radius: 10px;
-        }
-        """)
+        # No initial sheet here: the landing _go(0, ...) below applies
+        # _QSS_NEUTRAL, so setting one now would just be parsed and thrown away.
 
         # Exclusive nav group
         self.nav_group = QtWidgets.QButtonGroup(self)
@@ -1823,73 +2101,62 @@ class MainWindow(QtWidgets.QMainWindow):
         ):
             self.nav_group.addButton(b)
 
-        # Routing
-        self.btn_home.clicked.connect(lambda: self._go(0, self.btn_home))
-        self.btn_defaults.clicked.connect(lambda: self._go(1, self.btn_defaults))
-        self.btn_validate.clicked.connect(lambda: self._go(2, self.btn_validate))
-
-        # Convert parent routes to Music by default
-        self.btn_music.clicked.connect(lambda: self._go(3, self.btn_music))
-        self.btn_video.clicked.connect(lambda: self._go(4, self.btn_video))
-        self.btn_image.clicked.connect(lambda: self._go(5, self.btn_image))
-        self.btn_project.clicked.connect(lambda: self._go(6, self.btn_project))
-
-        # When defaults saved, refresh convert panels
-        self.page_defaults.defaultsSaved.connect(self.page_music.reload_defaults)
-        self.page_defaults.defaultsSaved.connect(self.page_video.reload_defaults)
-        self.page_defaults.defaultsSaved.connect(self.page_image.reload_defaults)
-        
+        # Routing — one slot for all nav buttons, resolved via sender()
+        self._nav_index: dict[QtWidgets.QAbstractButton, int] = {
+            self.btn_home: 0,
+            self.btn_defaults: 1,
+            self.btn_validate: 2,
+            self.btn_music: 3,
+            self.btn_video: 4,
+            self.btn_image: 5,
+            self.btn_project: 6,
+        }
+        for b in self._nav_index:
+            b.clicked.connect(self._on_nav_clicked)
+
         # Landing
         self._go(0, self.btn_home)
 
+    def _ensure_page(self, index: int) -> QtWidgets.QWidget:
+        w = self._page_cache.get(index)
+        if w is None:
+            w = self._page_factories[index]()
+            _tag_inputs(w)
+            self._page_cache[index] = w
+            self.pages.addWidget(w)
+            if index == 1:
+                # When defaults saved, refresh any convert panels built so far
+                w.defaultsSaved.connect(self._on_defaults_saved)
+        return w
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        # Let an in-flight validate batch wind down instead of grinding
+        # through the rest of the queue after the window is gone.
+        w = self._page_cache.get(2)
+        if w is not None:
+            w.cancel_active()
+        super().closeEvent(event)
+
+    def _on_defaults_saved(self) -> None:
+        for idx in (3, 4, 5):
+            w = self._page_cache.get(idx)
+            if w is not None:
+                w.reload_defaults()
+
     def _set_content_style(self, active: bool) -> None:
-        if active:
-            self.content_frame.setStyleSheet("""
-            QFrame#contentFrame {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3b3b3b,
-                    stop:1 #2e2e2e
-                );
-                border-radius: 10px;
-            }
-
-            /* Light satin inputs on dark metal */
-            QLineEdit, QTextEdit, QPlainTextEdit {
-                   background: #555;
-                   color: #ffffff;
-                   border: 1px solid #6a6a6a;
-                   border-radius: 6px;
-                   padding: 6px 8px;
-            }
-
-            QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {
-                background: #606060;
-                border: 1px solid #9a9a9a;
-            }
-
-            QLineEdit::placeholder, QTextEdit::placeholder, QPlainTextEdit::placeholder {
-                color: rgba(255, 255, 255, 0.55);
-            }
-            """)
-        else:
-            self.content_frame.setStyleSheet("""
-            QFrame#contentFrame {
-                background: #2b2b2b;
-                border-radius: 10px;
-            }  
-
-            QLineEdit, QTextEdit, QPlainTextEdit {
-                background: #444;
-                color: #eee;
-                border: 1px solid #555;
-                border-radius: 6px;
-                padding: 6px 8px;
-            }
-            """)
+        # Reassigning an identical sheet still re-polishes every descendant;
+        # skip when the active/neutral state has not changed.
+        if active == self._style_active:
+            return
+        self._style_active = active
+        self.content_frame.setStyleSheet(_QSS_ACTIVE if active else _QSS_NEUTRAL)
+
+    def _on_nav_clicked(self) -> None:
+        b = self.sender()
+        self._go(self._nav_index[b], b)
 
     def _go(self, index: int, check_btn: QtWidgets.QAbstractButton) -> None:
-        self.pages.setCurrentIndex(index)
+        self.pages.setCurrentWidget(self._ensure_page(index))
         self._set_content_style(index != 0)  # Home stays neutral
         check_btn.setChecked(True)
 
@@ -1916,8 +2183,18 @@ def main() -> None:
     QtWidgets.QApplication.setAttribute(
         QtCore.Qt.AA_DontShowIconsInMenus, True
     )
+    # Qt6 is always high-DPI aware; only the rounding policy and GL context
+    # sharing still need to be pinned before the app object exists.
+    QtGui.QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
+        QtCore.Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+    )
+    QtWidgets.QApplication.setAttribute(
+        QtCore.Qt.AA_ShareOpenGLContexts, True
+    )
 
     app = QtWidgets.QApplication(sys.argv)
+    app.setStyleSheet(_APP_QSS)
+    app.setWindowIcon(_app_icon())
     QtCore.QCoreApplication.setOrganizationName(PRODUCTION_ORG_NAME)
     QtCore.QCoreApplication.setApplicationName(PRODUCTION_APP_NAME)
     w = MainWindow()
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
 from platformdirs import user_config_dir
 
 
+# Both paths are constant per process; cache so repeated store/panel
+# round-trips skip the resolve()/mkdir syscalls.
+@functools.lru_cache(maxsize=1)
 def default_downloads_dir() -> Path:
     return (Path.home() / "Downloads").expanduser().resolve()
 
 
+@functools.lru_cache(maxsize=1)
 def _config_path() -> Path:
     cfg_dir = Path(user_config_dir("AIFX", "AI-First-Exchange")).expanduser()
     cfg_dir.mkdir(parents=True, exist_ok=True)
@@ -36,21 +42,29 @@ class DesktopSettings:
 class SettingsStore:
     def __init__(self) -> None:
         self.path = _config_path()
+        # (st_mtime_ns, parsed settings) — shared by every load() until
+        # the file on disk actually changes
+        self._cached: tuple[int, DesktopSettings] | None = None
 
     def load(self) -> DesktopSettings:
         d = default_downloads_dir()
         home = Path.home().resolve()
 
-        if not self.path.exists():
+        try:
+            st = self.path.stat()
+        except OSError:
             return DesktopSettings(
                 default_output_dir=str(d),
                 last_input_dir=str(home),
             )
 
+        if self._cached is not None and self._cached[0] == st.st_mtime_ns:
+            return self._cached[1]
+
         try:
             data = json.loads(self.path.read_text(encoding="utf-8"))
 
-            return DesktopSettings(
+            settings = DesktopSettings(
                 creator_name=str(data.get("creator_name", "")),
                 creator_email=str(data.get("creator_email", "")),
                 default_mode=str(data.get("default_mode", "human-directed-ai")),
@@ -66,5 +80,13 @@ class SettingsStore:
                 last_input_dir=str(home),
             )
 
+        self._cached = (st.st_mtime_ns, settings)
+        return settings
+
     def save(self, s: DesktopSettings) -> None:
-        self.path.write_text(json.dumps(asdict(s), indent=2), encoding="utf-8")
+        # Write-then-rename so a crash mid-save can't leave a truncated
+        # file for load()'s corruption fallback to discard.
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(asdict(s), indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._cached = None